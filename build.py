@@ -4,6 +4,17 @@ import os
 import re
 import shutil
 import subprocess
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+VERSION_RE = re.compile(
+	r"(?P<filevers>filevers=\(\d+, \d+, \d+, \d+\))"
+	r"|(?P<prodvers>prodvers=\(\d+, \d+, \d+, \d+\))"
+	r"|(?P<file_version>u'FileVersion', u'\d+\.\d+\.\d+')"
+	r"|(?P<product_version>u'ProductVersion', u'\d+\.\d+\.\d+')"
+)
 
 
 def clean():
@@ -12,17 +23,23 @@ def clean():
 	try:
 		dirs_to_clean = ["build", "dist", "__pycache__", "release", "VLC_Discord_RP"]
 
-		for dir_name in dirs_to_clean:
-			if os.path.exists(dir_name):
-				shutil.rmtree(dir_name)
+		with os.scandir(".") as entries:
+			existing = {entry.name for entry in entries}
+
+		existing_dirs = [dir_name for dir_name in dirs_to_clean if dir_name in existing]
+		if existing_dirs:
+			# Each tree is removed independently so one failure doesn't stop the others
+			with ThreadPoolExecutor(max_workers=len(existing_dirs)) as executor:
+				futures = [executor.submit(shutil.rmtree, dir_name) for dir_name in existing_dirs]
+			errors = [future.exception() for future in futures if future.exception()]
+			if errors:
+				raise errors[0]
 
-		for root, dirs, files in os.walk("."):
-			for file in files:
-				if file.endswith(".pyc"):
-					os.remove(os.path.join(root, file))
+		for pyc_file in Path(".").rglob("*.pyc"):
+			pyc_file.unlink(missing_ok=True)
 
 		zip_file = "VLC_Discord_RP.zip"
-		if os.path.exists(zip_file):
+		if zip_file in existing:
 			os.remove(zip_file)
 			print(f"Removed {zip_file}")
 
@@ -33,6 +50,13 @@ def clean():
 		return False
 
 
+def pyinstaller_env(config_dir):
+	"""Return an environment that gives a PyInstaller run its own cache directory"""
+	env = os.environ.copy()
+	env["PYINSTALLER_CONFIG_DIR"] = config_dir
+	return env
+
+
 def build_app(version=None, dev=False):
 	"""Build the VLC Discord RP application executable"""
 	print("Building VLC Discord Rich Presence application...")
@@ -43,19 +67,18 @@ def build_app(version=None, dev=False):
 	spec_file_path = os.path.join("spec", "app.spec")
 	if dev:
 		print("Development mode: Building with console window...")
-		with open(spec_file_path, "r") as f:
+		os.replace(spec_file_path, f"{spec_file_path}.bak")
+		with open(f"{spec_file_path}.bak", "r") as f:
 			spec_content = f.read()
 
-		with open(f"{spec_file_path}.bak", "w") as f:
-			f.write(spec_content)
-
 		spec_content = spec_content.replace("console=False", "console=True")
 
 		with open(spec_file_path, "w") as f:
 			f.write(spec_content)
 
 	try:
-		subprocess.run(["pyinstaller", "--clean", "spec/app.spec"], check=True)
+		with tempfile.TemporaryDirectory(prefix="pyinstaller-") as config_dir:
+			subprocess.run(["pyinstaller", "--clean", "spec/app.spec"], check=True, env=pyinstaller_env(config_dir))
 		print("Application build complete!")
 		success = os.path.exists(os.path.join("dist", "VLC Discord Presence.exe"))
 	except subprocess.CalledProcessError:
@@ -63,7 +86,7 @@ def build_app(version=None, dev=False):
 		success = False
 
 	if dev and os.path.exists(f"{spec_file_path}.bak"):
-		shutil.move(f"{spec_file_path}.bak", spec_file_path)
+		os.replace(f"{spec_file_path}.bak", spec_file_path)
 
 	return success
 
@@ -81,20 +104,13 @@ def update_version_info(version):
 		version_parts.append("0")
 	version_tuple = ", ".join(version_parts) + ", 0"
 
-	content = re.sub(
-		r"filevers=\(\d+, \d+, \d+, \d+\)", f"filevers=({version_tuple})", content
-	)
-	content = re.sub(
-		r"prodvers=\(\d+, \d+, \d+, \d+\)", f"prodvers=({version_tuple})", content
-	)
-	content = re.sub(
-		r"u'FileVersion', u'\d+\.\d+\.\d+'", f"u'FileVersion', u'{version}'", content
-	)
-	content = re.sub(
-		r"u'ProductVersion', u'\d+\.\d+\.\d+'",
-		f"u'ProductVersion', u'{version}'",
-		content,
-	)
+	replacements = {
+		"filevers": f"filevers=({version_tuple})",
+		"prodvers": f"prodvers=({version_tuple})",
+		"file_version": f"u'FileVersion', u'{version}'",
+		"product_version": f"u'ProductVersion', u'{version}'",
+	}
+	content = VERSION_RE.sub(lambda m: replacements[m.lastgroup], content)
 
 	with open(version_file_path, "w") as f:
 		f.write(content)
@@ -113,18 +129,22 @@ def build_installer():
 			return False
 
 		print("Running PyInstaller with spec/installer.spec...")
-		result = subprocess.run(
-			["pyinstaller", "--clean", "spec/installer.spec"],
-			check=True,
-			capture_output=True,
-			text=True,
-		)
-		print("PyInstaller output:")
-		print(result.stdout)
-
-		if result.stderr:
-			print("PyInstaller errors:")
-			print(result.stderr)
+		with tempfile.TemporaryDirectory(prefix="pyinstaller-") as config_dir:
+			process = subprocess.Popen(
+				["pyinstaller", "--clean", "spec/installer.spec"],
+				stdout=subprocess.PIPE,
+				stderr=subprocess.STDOUT,
+				text=True,
+				bufsize=1,
+				env=pyinstaller_env(config_dir),
+			)
+			for line in process.stdout:
+				print(line, end="")
+			returncode = process.wait()
+
+		if returncode != 0:
+			print(f"Installer build failed with return code: {returncode}")
+			return False
 
 		installer_path = os.path.join("dist", "VLC Discord RP Setup.exe")
 		if os.path.exists(installer_path):
@@ -134,11 +154,6 @@ def build_installer():
 			print(f"Installer not found at expected location {installer_path}")
 			return False
 
-	except subprocess.CalledProcessError as e:
-		print(f"Installer build failed with return code: {e.returncode}")
-		print("Output:", e.stdout)
-		print("Error:", e.stderr)
-		return False
 	except Exception as e:
 		print(f"Installer build failed: {e}")
 		return False
@@ -148,25 +163,20 @@ def package():
 	"""Package everything into a release zip"""
 	print("Creating release package...")
 	try:
-		release_dir = "release"
-		if os.path.exists(release_dir):
-			shutil.rmtree(release_dir)
-		os.makedirs(release_dir)
-
 		installer_path = os.path.join("dist", "VLC Discord RP Setup.exe")
-		if os.path.exists(installer_path):
-			shutil.copy2(
-				installer_path, os.path.join(release_dir, "VLC Discord RP Setup.exe")
-			)
-		else:
+		if not os.path.exists(installer_path):
 			print("Warning: Installer executable not found.")
 			return False
 
-		for file in ["README.md", "LICENSE", "CHANGELOG.md"]:
-			if os.path.exists(file):
-				shutil.copy2(file, os.path.join(release_dir, file))
+		with os.scandir(".") as entries:
+			existing = {entry.name for entry in entries}
+
+		with zipfile.ZipFile("VLC_Discord_RP.zip", "w", zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+			archive.write(installer_path, "VLC Discord RP Setup.exe")
+			for file in ["README.md", "LICENSE", "CHANGELOG.md"]:
+				if file in existing:
+					archive.write(file, file)
 
-		shutil.make_archive("VLC_Discord_RP", "zip", release_dir)
 		print("Release package created: VLC_Discord_RP.zip")
 		return os.path.exists("VLC_Discord_RP.zip")
 	except Exception as e:
@@ -6,18 +6,94 @@ import struct
 class Image:
 	"""A minimal class that mimics the PIL.Image.Image interface needed by pystray"""
 
+	# Raw pixel buffers shared between instances, keyed by (width, height, color)
+	_DATA_CACHE = {}
+	# Generated ICO files, keyed by (width, height, color)
+	_ICO_CACHE = {}
+	# Images returned by open(), keyed by (path, mtime, size)
+	_OPEN_CACHE = {}
+	# Images returned by new(), keyed by (mode, width, height, color)
+	_NEW_CACHE = {}
+
 	def __init__(self, width, height, color=(90, 0, 175), source_path=None):
 		self.width = width
 		self.height = height
 		self.color = color
 		self.mode = "RGBA"
-		self._data = bytes([color[0], color[1], color[2], 255] * (width * height))
+		self._data = None
 		self._source_path = source_path
 		self._temp_path = None
 
+	@property
+	def data(self):
+		"""Raw RGBA pixel data, built on first access"""
+		if self._data is None:
+			key = (self.width, self.height, tuple(self.color))
+			data = Image._DATA_CACHE.get(key)
+			if data is None:
+				r, g, b = self.color[:3]
+				data = bytes((r, g, b, 255)) * (self.width * self.height)
+				Image._DATA_CACHE[key] = data
+			self._data = data
+		return self._data
+
 	def tobytes(self):
 		"""Return raw bytes representing the image"""
-		return self._data
+		return self.data
+
+	def _ico_payload(self):
+		"""Return the bytes of a generated ICO file, built once per size and color"""
+		key = (self.width, self.height, tuple(self.color))
+		payload = Image._ICO_CACHE.get(key)
+		if payload is not None:
+			return payload
+
+		width = self.width
+		height = self.height
+
+		size = 40 + width * height * 4
+
+		header = struct.pack(
+			"<HHH",
+			0,  # Reserved
+			1,  # Image type: 1 = ICO
+			1,  # Number of images
+		)
+
+		directory = struct.pack(
+			"<BBBBHHII",
+			width if width < 256 else 0,  # Width
+			height if height < 256 else 0,  # Height
+			0,  # Color count
+			0,  # Reserved
+			1,  # Color planes
+			32,  # Bits per pixel
+			size,  # Size of bitmap data
+			22,  # Offset to bitmap data
+		)
+
+		bmp_header = struct.pack(
+			"<IIIHHIIIIII",
+			40,  # biSize
+			width,  # biWidth
+			height * 2,  # biHeight (doubled for ICO format)
+			1,  # biPlanes
+			32,  # biBitCount
+			0,  # biCompression
+			width * height * 4,  # biSizeImage
+			0,  # biXPelsPerMeter
+			0,  # biYPelsPerMeter
+			0,  # biClrUsed
+			0,  # biClrImportant
+		)
+
+		# Every pixel has the same color, so row order (bottom-up) doesn't matter
+		r, g, b = self.color[:3]
+		bitmap_data = bytes((b, g, r, 255)) * (width * height)  # BGRA
+
+		payload = b"".join((header, directory, bmp_header, bitmap_data))
+		Image._ICO_CACHE[key] = payload
+		return payload
 
 	def save(self, fp, format=None):
 		"""Save the image to a file or file-like object"""
@@ -31,100 +107,61 @@ class Image:
 		else:
 			# Fall back to generating a basic ICO
 			if format == "ICO":
-				width = self.width
-				height = self.height
-
-				header = bytes(
-					[
-						0,
-						0,  # Reserved
-						1,
-						0,  # Image type: 1 = ICO
-						1,
-						0,  # Number of images
-					]
-				)
-
-				directory = bytes(
-					[
-						width if width < 256 else 0,  # Width
-						height if height < 256 else 0,  # Height
-						0,  # Color count
-						0,  # Reserved
-						1,
-						0,  # Color planes
-						32,
-						0,  # Bits per pixel
-						(40 + (width * height * 4)) & 0xFF,  # Size of bitmap data
-						((40 + (width * height * 4)) >> 8) & 0xFF,
-						((40 + (width * height * 4)) >> 16) & 0xFF,
-						((40 + (width * height * 4)) >> 24) & 0xFF,
-						22,
-						0,
-						0,
-						0,  # Offset to bitmap data
-					]
-				)
-
-				bmp_header = struct.pack(
-					"<IIIHHIIIIII",
-					40,  # biSize
-					width,  # biWidth
-					height * 2,  # biHeight (doubled for ICO format)
-					1,  # biPlanes
-					32,  # biBitCount
-					0,  # biCompression
-					width * height * 4,  # biSizeImage
-					0,  # biXPelsPerMeter
-					0,  # biYPelsPerMeter
-					0,  # biClrUsed
-					0,  # biClrImportant
-				)
-
-				bitmap_data = bytearray()
-				r, g, b = self.color
-				for y in range(height - 1, -1, -1):  # Bottom-up
-					for x in range(width):
-						bitmap_data.extend([b, g, r, 255])  # BGRA
+				payload = self._ico_payload()
 
 				if hasattr(fp, "write"):
-					fp.write(header + directory + bmp_header + bitmap_data)
+					fp.write(payload)
 				else:
 					with open(fp, "wb") as f:
-						f.write(header + directory + bmp_header + bitmap_data)
+						f.write(payload)
 			else:
 				# For other formats, write RGB data
 				if hasattr(fp, "write"):
-					fp.write(self._data)
+					fp.write(self.data)
 				else:
-					with open(fp, "wb") as f:
-						f.write(self._data)
+					# Unbuffered write so the whole buffer goes out in as few syscalls as possible
+					fd = os.open(fp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+					try:
+						view = memoryview(self.data)
+						while view:
+							view = view[os.write(fd, view) :]
+					finally:
+						os.close(fd)
 
 	@staticmethod
 	def open(path):
 		"""Open an image file and return an Image object"""
 		try:
-			if not os.path.exists(path):
-				return Image(64, 64)
-
-			with open(path, "rb") as f:
+			stat = os.stat(path)
+			key = (path, stat.st_mtime_ns, stat.st_size)
+			image = Image._OPEN_CACHE.get(key)
+			if image is not None:
+				return image
+
+			fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+			try:
 				# Try to detect the format
-				header = f.read(24)
-
-				if header.startswith(b"\x89PNG\r\n\x1a\n"):
-					width = int.from_bytes(header[16:20], byteorder="big")
-					height = int.from_bytes(header[20:24], byteorder="big")
-					return Image(width, height, source_path=path)
-
-				if header.startswith(b"\x00\x00\x01\x00"):
-					width = header[6]
-					width = 256 if width == 0 else width
-					height = header[7]
-					height = 256 if height == 0 else height
-					# Store the original path in the image object
-					return Image(width, height, source_path=path)
-
-				return Image(64, 64)
+				header = os.read(fd, 24)
+			finally:
+				os.close(fd)
+
+			view = memoryview(header)
+			if header.startswith(b"\x89PNG\r\n\x1a\n"):
+				width = int.from_bytes(view[16:20], byteorder="big")
+				height = int.from_bytes(view[20:24], byteorder="big")
+				image = Image(width, height, source_path=path)
+			elif header.startswith(b"\x00\x00\x01\x00"):
+				width = view[6]
+				width = 256 if width == 0 else width
+				height = view[7]
+				height = 256 if height == 0 else height
+				# Store the original path in the image object
+				image = Image(width, height, source_path=path)
+			else:
+				image = Image(64, 64)
+
+			Image._OPEN_CACHE[key] = image
+			return image
 		except (IOError, OSError):
 			return Image(64, 64)
 
@@ -132,4 +169,10 @@ class Image:
 	def new(mode, size, color=(90, 0, 175)):
 		"""Mock Image.new method"""
 		width, height = size if isinstance(size, tuple) else (size, size)
-		return Image(width, height, color)
+		# Images are never modified after creation, so identical requests can share one
+		key = (mode, width, height, tuple(color))
+		image = Image._NEW_CACHE.get(key)
+		if image is None:
+			image = Image(width, height, color)
+			Image._NEW_CACHE[key] = image
+		return image